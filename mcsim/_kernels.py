@@ -0,0 +1,183 @@
+import functools
+
+import numpy as np
+from numba import njit, prange
+
+
+@njit(cache=True, fastmath=True)
+def local_energy(a, i, j, sx, sy, sz, B, K, u, J, D):
+    """Energy of all terms involving the spin (sx, sy, sz) at site (i, j).
+
+    Compiled counterpart of ``System.local_energy`` working on a raw
+    ``(nx, ny, 3)`` spin array and the system parameters.
+
+    """
+    nx, ny = a.shape[0], a.shape[1]
+
+    us = u[0] * sx + u[1] * sy + u[2] * sz
+    total_energy = -(B[0] * sx + B[1] * sy + B[2] * sz) - K * us * us
+
+    #neighbours in the x direction, dmi along [0, 1, 0]
+    if i + 1 < nx:
+        rx, ry, rz = a[i + 1, j, 0], a[i + 1, j, 1], a[i + 1, j, 2]
+        total_energy -= J * (sx * rx + sy * ry + sz * rz) + D * (sz * rx - sx * rz)
+    if i > 0:
+        lx, ly, lz = a[i - 1, j, 0], a[i - 1, j, 1], a[i - 1, j, 2]
+        total_energy -= J * (lx * sx + ly * sy + lz * sz) + D * (lz * sx - lx * sz)
+
+    #neighbours in the y direction, dmi along [1, 0, 0]
+    if j + 1 < ny:
+        tx, ty, tz = a[i, j + 1, 0], a[i, j + 1, 1], a[i, j + 1, 2]
+        total_energy -= J * (sx * tx + sy * ty + sz * tz) + D * (sy * tz - sz * ty)
+    if j > 0:
+        dx, dy, dz = a[i, j - 1, 0], a[i, j - 1, 1], a[i, j - 1, 2]
+        total_energy -= J * (dx * sx + dy * sy + dz * sz) + D * (dy * sz - dz * sy)
+
+    return total_energy
+
+
+@functools.lru_cache(maxsize=32)
+def make_mc_sweep(B, K, u, J, D):
+    """Monte Carlo kernel specialised for the system parameters.
+
+    ``B`` and ``u`` are tuples of floats and ``K``, ``J`` and ``D`` floats.
+    They are captured by the compiled function as compile-time constants, so
+    the compiler folds them into the arithmetic and removes the terms of zero
+    components, e.g. for ``B = (0, 0, Bz)`` or ``u = (0, 0, 1)``.
+
+    The kernels are not cached on disk, so every new parameter set costs one
+    compilation (a fraction of a second, more for ``make_mc_sweep_batch``).
+    The most recently used kernels are kept in memory, so repeated runs with
+    the same parameters are compiled only once, while a scan over many
+    parameter sets does not keep every kernel alive.
+
+    Returns
+    -------
+    function
+
+        Compiled ``sweep(a, sites, deltas, uniforms, beta)``.
+
+    """
+    @njit(fastmath=True)
+    def sweep(a, sites, deltas, uniforms, beta):
+        """Run Monte Carlo steps in place on the ``(nx, ny, 3)`` spin array.
+
+        A single update reads all three components of a site and its
+        neighbours, so the array is expected to hold the components of each
+        spin next to each other (C order), unlike the component planes of
+        ``Spins``.
+
+        Step k modifies the spin at site ``sites[k]`` by ``deltas[k]`` as in
+        ``driver.random_spin``. The move is kept if the energy decreases or,
+        with the Metropolis rule, if ``uniforms[k] < exp(-beta * dE)``. An
+        empty ``uniforms`` array means zero temperature: only moves that
+        decrease the energy are kept and ``beta`` is not used. All arrays are
+        drawn by the caller, one row per step.
+
+        Returns the total energy change of all accepted steps.
+
+        """
+        total_dE = 0.0
+        metropolis = uniforms.shape[0] > 0
+
+        for k in range(sites.shape[0]):
+            i, j = sites[k, 0], sites[k, 1]
+
+            ox, oy, oz = a[i, j, 0], a[i, j, 1], a[i, j, 2]
+
+            sx = ox + deltas[k, 0]
+            sy = oy + deltas[k, 1]
+            sz = oz + deltas[k, 2]
+            norm = np.sqrt(sx * sx + sy * sy + sz * sz)
+            sx /= norm
+            sy /= norm
+            sz /= norm
+
+            dE = (local_energy(a, i, j, sx, sy, sz, B, K, u, J, D)
+                  - local_energy(a, i, j, ox, oy, oz, B, K, u, J, D))
+
+            if dE < 0 or (metropolis and uniforms[k] < np.exp(-beta * dE)):
+                a[i, j, 0] = sx
+                a[i, j, 1] = sy
+                a[i, j, 2] = sz
+                total_dE += dE
+
+        return total_dE
+
+    return sweep
+
+
+@functools.lru_cache(maxsize=32)
+def make_mc_sweep_batch(B, K, u, J, D):
+    """Monte Carlo kernel running independent chains in parallel.
+
+    Parameters are the same as for ``make_mc_sweep``.
+
+    Returns
+    -------
+    function
+
+        Compiled ``sweep_batch(a, sites, deltas, uniforms, beta)``.
+
+    """
+    sweep = make_mc_sweep(B, K, u, J, D)
+
+    @njit(parallel=True)
+    def sweep_batch(a, sites, deltas, uniforms, beta):
+        """Run Monte Carlo steps in place on a ``(nchain, nx, ny, 3)`` array.
+
+        Chain c is updated by ``sweep`` with ``sites[c]``, ``deltas[c]`` and
+        ``uniforms[c]``. The chains are independent and are distributed over
+        the available threads.
+
+        Returns the total energy change of all accepted steps, per chain.
+
+        """
+        total_dE = np.zeros(a.shape[0])
+
+        for c in prange(a.shape[0]):
+            total_dE[c] = sweep(a[c], sites[c], deltas[c], uniforms[c], beta)
+
+        return total_dE
+
+    return sweep_batch
+
+
+@njit(cache=True, fastmath=True)
+def bond_sums(px, py, pz):
+    """Exchange and dmi sums over all nearest-neighbour pairs in one pass.
+
+    ``px``, ``py`` and ``pz`` are the ``(nx, ny)`` component planes of the
+    spins. Every site is visited once, and the pairs it forms with its x and y
+    neighbours contribute to both sums, which are accumulated in double
+    precision.
+
+    Returns
+    -------
+    tuple
+
+        ``(exchange, dmi)``: sum of the scalar products and sum of the dmi
+        cross product components over all pairs.
+
+    """
+    nx, ny = px.shape
+    ex = 0.0
+    dmi = 0.0
+
+    for i in range(nx):
+        for j in range(ny):
+            ax, ay, az = float(px[i, j]), float(py[i, j]), float(pz[i, j])
+
+            #pair in the x direction, dmi along [0, 1, 0]
+            if i + 1 < nx:
+                bx, by, bz = float(px[i + 1, j]), float(py[i + 1, j]), float(pz[i + 1, j])
+                ex += ax * bx + ay * by + az * bz
+                dmi += az * bx - ax * bz
+
+            #pair in the y direction, dmi along [1, 0, 0]
+            if j + 1 < ny:
+                bx, by, bz = float(px[i, j + 1]), float(py[i, j + 1]), float(pz[i, j + 1])
+                ex += ax * bx + ay * by + az * bz
+                dmi += ay * bz - az * by
+
+    return ex, dmi
@@ -1,7 +1,11 @@
+import math
+
 import numpy as np
 
+from ._kernels import make_mc_sweep, make_mc_sweep_batch
+
 
-def random_spin(s0, alpha=0.1):
+def random_spin(s0, alpha=0.1, rng=None):
     """Generate a new random spin based on the original one.
 
     Parameters
@@ -14,6 +18,11 @@ def random_spin(s0, alpha=0.1):
 
         Larger alpha, larger the modification of the spin. Defaults to 0.1.
 
+    rng: np.random.Generator, optional
+
+        Random number generator to draw the modification from. Defaults to
+        ``None``, in which case the global numpy random state is used.
+
     Returns
     -------
     np.ndarray
@@ -21,22 +30,44 @@ def random_spin(s0, alpha=0.1):
         New updated spin, normalised to 1.
 
     """
-    delta_s = (2 * np.random.random(3) - 1) * alpha
-    s1 = s0 + delta_s
-    return s1 / np.linalg.norm(s1)
+    random = np.random.random if rng is None else rng.random
+
+    #the three components are handled as python floats, which is much cheaper
+    #than numpy operations on a length-3 array
+    s0x, s0y, s0z = map(float, s0)
+    sx = s0x + (2 * random() - 1) * alpha
+    sy = s0y + (2 * random() - 1) * alpha
+    sz = s0z + (2 * random() - 1) * alpha
+    norm = math.sqrt(sx * sx + sy * sy + sz * sz)
+
+    return np.array((sx / norm, sy / norm, sz / norm))
+
+
+def _parameters(system):
+    """System parameters ``(B, K, u, J, D)`` in the form the kernels are specialised on."""
+    return (tuple(map(float, system.B)), float(system.K),
+            tuple(map(float, system.u)), float(system.J), float(system.D))
 
 
 class Driver:
     """Driver class.
 
-    Driver class does not take any input parameters at initialisation.
+    Parameters
+    ----------
+    seed: int, optional
+
+        Seed of the random number generator used by the driver. Defaults to
+        ``None``, in which case fresh entropy is used.
 
     """
 
-    def __init__(self):
-        pass
+    #number of Monte Carlo steps whose random numbers are drawn at once
+    batch_size = 100_000
+
+    def __init__(self, seed=None):
+        self.rng = np.random.default_rng(seed)
 
-    def drive(self, system, n, alpha=0.1):
+    def drive(self, system, n, alpha=0.1, beta=np.inf):
         """perform the monte carlo algorithm with n iterations
 
         Parameters
@@ -51,24 +82,106 @@ class Driver:
 
             Larger alpha, larger the modification of the spin. Defaults to 0.1.
 
+        beta: float
+
+            Inverse temperature of the Metropolis acceptance rule: a move that
+            increases the energy by dE is kept with probability exp(-beta*dE).
+            Defaults to ``np.inf``, in which case only moves that decrease the
+            energy are kept.
+
         Returns
         -------
 
+        The total energy after the last iteration is stored in
+        ``system.current_energy``. It is updated with the energy change of
+        every accepted move instead of being recomputed over the lattice.
+
         """
-        for _ in range(n):
-            E0 = system.energy()
-            i, j = np.random.randint(0, system.s.n[0]), np.random.randint(0, system.s.n[1]) #select i and j at random
+        nx, ny = system.s.sx.shape #s.array may have been replaced by one of another shape
+        energy = system.energy()
+        metropolis = np.isfinite(beta)
 
-            original_spin = system.s.array[i, j].copy() #we keep a copy of the spin just in case
-            system.s.array[i, j] = random_spin(original_spin, alpha)
+        #the spins are stored as separate component planes, which suits the
+        #energy sums over the whole lattice; a single update needs all
+        #components of a few neighbouring sites, so the kernel works on an
+        #interleaved (nx, ny, 3) copy that is written back at the end
+        spins = np.ascontiguousarray(system.s.array)
+        sweep = make_mc_sweep(*_parameters(system))
 
-            E1 = system.energy()
+        #random numbers are drawn in batches and the loop over each batch runs
+        #in a single compiled kernel, see mcsim/_kernels.py
+        for start in range(0, n, self.batch_size):
+            size = min(self.batch_size, n - start)
+            sites = self.rng.integers(0, (nx, ny), size=(size, 2))
+            deltas = (2 * self.rng.random((size, 3)) - 1) * alpha
+            uniforms = self.rng.random(size) if metropolis else np.empty(0)
 
-            if E1 >= E0:
-                system.s.array[i, j] = original_spin
+            energy += sweep(spins, sites, deltas, uniforms, float(beta) if metropolis else 0.0)
 
+        system.s.array[...] = spins
+        system.current_energy = energy
 
+    def drive_batch(self, systems, n, alpha=0.1, beta=np.inf):
+        """perform the monte carlo algorithm with n iterations on several systems
 
+        Every system is an independent Markov chain, and the chains are run in
+        parallel over the available CPU cores.
 
+        Parameters
+        ----------
+        systems: Iterable of System objects with the same lattice dimensions and
+        the same parameters B, K, u, J and D, each with its own Spins object
+
+        n : int
 
+            number of iteration of every chain
+
+        alpha: float
+
+            Larger alpha, larger the modification of the spin. Defaults to 0.1.
 
+        beta: float
+
+            Inverse temperature of the Metropolis acceptance rule, as in
+            ``drive``. Defaults to ``np.inf``.
+
+        Returns
+        -------
+
+        The total energy of every system after the last iteration is stored in
+        its ``current_energy``.
+
+        """
+        systems = list(systems)
+        if not systems:
+            raise ValueError("At least one system is required.")
+
+        nx, ny = systems[0].s.sx.shape
+        parameters = _parameters(systems[0])
+
+        if any(system.s.sx.shape != (nx, ny) or _parameters(system) != parameters for system in systems):
+            raise ValueError("All systems must have the same lattice dimensions and parameters.")
+        #every chain is written back to its own spins, which must not be shared
+        if len({id(system.s) for system in systems}) != len(systems):
+            raise ValueError("Systems must not share the same Spins object.")
+
+        energies = np.array([system.energy() for system in systems])
+        metropolis = np.isfinite(beta)
+
+        #one interleaved (nx, ny, 3) copy per chain, see drive
+        spins = np.stack([system.s.array for system in systems])
+        sweep_batch = make_mc_sweep_batch(*parameters)
+
+        #the batch size is shared between the chains to bound the memory used
+        batch_size = max(1, self.batch_size // len(systems))
+        for start in range(0, n, batch_size):
+            size = min(batch_size, n - start)
+            sites = self.rng.integers(0, (nx, ny), size=(len(systems), size, 2))
+            deltas = (2 * self.rng.random((len(systems), size, 3)) - 1) * alpha
+            uniforms = self.rng.random((len(systems), size)) if metropolis else np.empty((len(systems), 0))
+
+            energies += sweep_batch(spins, sites, deltas, uniforms, float(beta) if metropolis else 0.0)
+
+        for system, chain, energy in zip(systems, spins, energies):
+            system.s.array[...] = chain
+            system.current_energy = energy
@@ -14,6 +14,14 @@ class Spins:
     and y directions, respectively, and 3 to hold all three vector components of
     the spin.
 
+    The components are stored as three contiguous ``(nx, ny)`` planes
+    (``self.sx``, ``self.sy`` and ``self.sz``) and ``self.array`` is a view on
+    them, so writing to ``self.array`` updates the planes. Each plane is kept
+    C-contiguous, with y the fastest varying index, so ``ravel()`` returns a
+    view: y neighbours are adjacent elements and x neighbours are ``ny``
+    elements apart. The bond sums of the energy terms rely on this to form
+    their scalar products from flat views of the planes.
+
     Parameters
     ----------
     n: Iterable
@@ -28,9 +36,16 @@ class Spins:
         lattice. All elements of ``value`` must be real numbers. Defaults to
         ``(0, 0, 1)``.
 
+    dtype: np.dtype
+
+        Floating point type of the spin components. ``np.float32`` halves the
+        memory traffic of the energy calculations, whose sums are still
+        accumulated in double precision. Must be ``np.float32`` or
+        ``np.float64``. Defaults to ``np.float64``.
+
     """
 
-    def __init__(self, n, value=(0, 0, 1)):
+    def __init__(self, n, value=(0, 0, 1), dtype=np.float64):
         # Checks on input parameters.
         if len(n) != 2:
             raise ValueError(f"Length of iterable n must be 2, not {len(n)=}.")
@@ -42,14 +57,46 @@ class Spins:
         if any(not isinstance(i, numbers.Real) for i in n):
             raise ValueError("Elements of value must be real numbers.")
 
+        try:
+            dtype = np.dtype(dtype)
+        except TypeError:
+            dtype = None
+        if dtype not in (np.float32, np.float64):
+            raise ValueError("dtype must be np.float32 or np.float64.")
+
         self.n = n
-        self.array = np.empty((*self.n, 3), dtype=np.float64)
+        self.dtype = dtype
+        self._planes = np.empty((3, *self.n), dtype=self.dtype)
         self.array[..., :] = value
 
         if not np.isclose(value[0] ** 2 + value[1] ** 2 + value[2] ** 2, 1):
             # we ensure all spins' magnitudes are normalised to 1.
             self.normalise()
 
+    @property
+    def array(self):
+        """Spins as an ``(nx, ny, 3)`` view on the component planes."""
+        return np.moveaxis(self._planes, 0, -1)
+
+    @array.setter
+    def array(self, value):
+        self._planes = np.ascontiguousarray(np.moveaxis(np.asarray(value, dtype=self.dtype), -1, 0))
+
+    @property
+    def sx(self):
+        """x components of all spins, shape ``(nx, ny)``."""
+        return self._planes[0]
+
+    @property
+    def sy(self):
+        """y components of all spins, shape ``(nx, ny)``."""
+        return self._planes[1]
+
+    @property
+    def sz(self):
+        """z components of all spins, shape ``(nx, ny)``."""
+        return self._planes[2]
+
     @property
     def mean(self):
         """spins mean.
@@ -64,11 +111,7 @@ class Spins:
 
         """
         #mean over each spin index
-        mx = np.mean(self.array[..., 0])
-        my = np.mean(self.array[..., 1])
-        mz = np.mean(self.array[..., 2])
-        
-        return np.array([mx, my, mz])
+        return self._planes.mean(axis=(1, 2), dtype=np.float64)
 
 
     def __abs__(self):
@@ -83,19 +126,11 @@ class Spins:
             norm over each spin 
 
         """
-        nx, ny, nz = self.array.shape
-        self.norm = np.zeros((nx, ny, 1))
-
-        for i in range(nx):
-            for j in range(ny):
-                spin = self.array[i, j]
-                self.norm[i, j, 0] = np.sqrt(spin[0]**2 + spin[1]**2 + spin[2]**2)
-                
-        return self.norm
-                
+        return np.sqrt(self.sx**2 + self.sy**2 + self.sz**2)[..., np.newaxis]
+
     def normalise(self):
         """Normalise the magnitude of all spins to 1."""
-        self.array = self.array / abs(self)  # This computation will be failing until you implement __abs__.
+        np.divide(self._planes, np.linalg.norm(self._planes, axis=0), out=self._planes)
 
     def randomise(self):
         """Initialise the lattice with random spins.
@@ -104,7 +139,9 @@ class Spins:
         spins are normalised to 1.
 
         """
-        self.array = 2 * np.random.random((*self.n, 3)) - 1
+        self._planes = np.random.random((3, *self.n)).astype(self.dtype, copy=False)
+        self._planes *= 2
+        self._planes -= 1
         self.normalise()
 
     def plot(self):
@@ -117,9 +154,9 @@ class Spins:
         x, y = np.meshgrid(np.arange(nx), np.arange(ny))
 
         #obtain the spin components
-        u = self.array[..., 0]
-        v = self.array[..., 1]
-        w = self.array[..., 2]
+        u = self.sx
+        v = self.sy
+        w = self.sz
 
         fig, ax = plt.subplots(figsize=(10, 10))
 
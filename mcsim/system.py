@@ -1,5 +1,35 @@
 import numpy as np
 
+from . import _kernels
+
+
+def _dot(a, b):
+    """Scalar product of two one-dimensional arrays, accumulated in double precision."""
+    return np.einsum('i,i->', a, b, dtype=np.float64)
+
+
+def _x_bonds(p, q):
+    """Sum of ``p[i, j] * q[i + 1, j]`` over all pairs in the x direction.
+
+    ``p`` and ``q`` are C-contiguous ``(nx, ny)`` component planes. On the
+    flattened planes the x neighbour of an element is ``ny`` elements further,
+    so the sum is a single scalar product of two contiguous views.
+
+    """
+    ny = p.shape[1]
+    return _dot(p.ravel()[:-ny], q.ravel()[ny:])
+
+
+def _y_bonds(p, q):
+    """Sum of ``p[i, j] * q[i, j + 1]`` over all pairs in the y direction.
+
+    On the flattened planes consecutive elements are y neighbours, except for
+    the last element of a row and the first element of the next row, whose
+    products are subtracted again.
+
+    """
+    return _dot(p.ravel()[:-1], q.ravel()[1:]) - _dot(p[:-1, -1], q[1:, 0])
+
 
 class System:
     """System object with the spin configuration and necessary parameters.
@@ -21,7 +51,8 @@ class System:
     u: Iterable(float)
 
         Uniaxial anisotropy axis, length 3. If ``u`` is not normalised to 1, it
-        will be normalised before the calculation of uniaxial anisotropy energy.
+        is normalised once when the system is created. The value passed in is
+        copied and never modified.
 
     J: numbers.Real
 
@@ -29,7 +60,10 @@ class System:
 
     D: numbers.Real
 
-        Dzyaloshinskii-Moriya energy constant.
+        Dzyaloshinskii-Moriya energy constant. The dmi vector of a bond is
+        fixed to ``(0, 1, 0)`` for neighbours in the x direction and to
+        ``(1, 0, 0)`` for neighbours in the y direction, so only one component
+        of each cross product is ever evaluated.
 
     """
 
@@ -37,9 +71,12 @@ class System:
         self.s = s
         self.J = J
         self.D = D
-        self.B = B
+        #vectors share the dtype of the spins so that energy terms are not upcast
+        self.B = np.array(B, dtype=s.dtype)
         self.K = K
-        self.u = u
+        self.u = (np.asarray(u, dtype=np.float64) / np.linalg.norm(u)).astype(s.dtype) #normalised once here
+        self.current_energy = None #total energy after the last Driver.drive call
+        self._dots = None #u.s for every spin, allocated and reused by anisotropy()
 
     def energy(self):
         """Total energy of the system.
@@ -54,8 +91,54 @@ class System:
             Total energy of the system.
 
         """
-        #print("Total energy:", self.zeeman() + self.anisotropy() + self.exchange() + self.dmi())
-        return self.zeeman() + self.anisotropy() + self.exchange() + self.dmi()
+        if self.J < 0:
+            raise ValueError("J must be >0")
+        if self.D < 0:
+            raise ValueError("D must be > 0 ")
+
+        #exchange and dmi share their pairs and are summed in a single
+        #compiled pass over the lattice, see mcsim/_kernels.py
+        ex, dmi = _kernels.bond_sums(self.s.sx, self.s.sy, self.s.sz)
+
+        return self.zeeman() + self.anisotropy() - self.J * ex - self.D * dmi
+
+    def local_energy(self, i, j, spin):
+        """Energy of all terms involving the spin at site (i, j).
+
+        Only the on-site terms and the bonds to the (at most four) nearest
+        neighbours of (i, j) are evaluated, so the energy change of a single
+        spin update is ``local_energy(i, j, new) - local_energy(i, j, old)``.
+
+        Parameters
+        ----------
+        i, j: int
+
+            Indices of the lattice site.
+
+        spin: np.ndarray
+
+            Spin ``(sx, sy, sz)`` placed at site (i, j).
+
+        Returns
+        -------
+        float
+
+            Local energy of the site.
+
+        """
+        #the kernel does not check its indices
+        nx, ny = self.s.sx.shape
+        if not (0 <= i < nx and 0 <= j < ny):
+            raise IndexError(f"Site ({i}, {j}) is outside the lattice of shape ({nx}, {ny}).")
+        if len(spin) != 3:
+            raise ValueError(f"Length of spin must be 3, not {len(spin)=}.")
+
+        #python floats keep the kernel to a single compiled specialisation
+        sx, sy, sz = (float(c) for c in spin)
+
+        #evaluated by the same compiled kernel that Driver.drive uses
+        return _kernels.local_energy(self.s.array, i, j, sx, sy, sz,
+                                     self.B, float(self.K), self.u, float(self.J), float(self.D))
 
     def zeeman(self):
         """Total zeeman energy.
@@ -69,12 +152,11 @@ class System:
             Total zeeman energy of the system.
 
         """
-        total_energy = 0
+        Bx, By, Bz = self.B
 
-        for spin in self.s.array.reshape(-1, 3): #each line will represent a spin
-            total_energy -= np.dot(spin, self.B)
-        
-        return total_energy
+        return -(Bx * self.s.sx.sum(dtype=np.float64)
+                 + By * self.s.sy.sum(dtype=np.float64)
+                 + Bz * self.s.sz.sum(dtype=np.float64))
 
     def anisotropy(self):
         """Total anisotropy energy.
@@ -88,14 +170,14 @@ class System:
             Total anisotropy energy of the system.
 
         """
-        self.u /= np.linalg.norm(self.u)
+        #self.s may have been replaced or resized since the last call
+        if self._dots is None or self._dots.shape != self.s.sx.shape or self._dots.dtype != self.s.sx.dtype:
+            self._dots = np.empty_like(self.s.sx)
 
-        total_energy = 0
-        
-        for spin in self.s.array.reshape(-1, 3):
-            total_energy -= self.K * (np.dot(spin, self.u) ** 2)
+        np.einsum('ijk,k->ij', self.s.array, self.u.astype(self.s.sx.dtype, copy=False), out=self._dots)
+        dots = self._dots.ravel()
 
-        return total_energy
+        return -self.K * _dot(dots, dots)
 
     def exchange(self):
         
@@ -113,11 +195,15 @@ class System:
         if self.J < 0:
             raise ValueError("J must be >0")
             
-        nx_interactions = np.sum(self.s.array[:-1, :, :] * self.s.array[1:, :, :], axis=2) #scalar product in the x direction
-        
-        ny_interactions = np.sum(self.s.array[:, :-1, :] * self.s.array[:, 1:, :], axis=2) #scalar product in the y direction
+        sx, sy, sz = self.s.sx, self.s.sy, self.s.sz
 
-        total_interactions = np.sum(nx_interactions) + np.sum(ny_interactions)
+        #scalar product in the x direction
+        nx_interactions = _x_bonds(sx, sx) + _x_bonds(sy, sy) + _x_bonds(sz, sz)
+
+        #scalar product in the y direction
+        ny_interactions = _y_bonds(sx, sx) + _y_bonds(sy, sy) + _y_bonds(sz, sz)
+
+        total_interactions = nx_interactions + ny_interactions
 
         total_energy = -self.J * total_interactions
         
@@ -140,17 +226,13 @@ class System:
         if self.D < 0:
             raise ValueError("D must be > 0 ")
 
-        cross_product_nx = np.cross(self.s.array[:-1, :, :], self.s.array[1:, :, :], axis=2) #vector product
-        cross_product_ny = np.cross(self.s.array[:, :-1, :], self.s.array[:, 1:, :], axis=2)
-
-        direction_nx = np.full_like(cross_product_nx, [0, 1, 0]) #new array with the same shape as the first argument and filled with [0,1,0]
-        direction_ny = np.full_like(cross_product_ny, [1, 0, 0])
+        #only one component of each cross product is needed:
+        #[0, 1, 0].(a x b) = az*bx - ax*bz and [1, 0, 0].(a x b) = ay*bz - az*by
+        sx, sy, sz = self.s.sx, self.s.sy, self.s.sz
+        dmi_nx = _x_bonds(sz, sx) - _x_bonds(sx, sz)
+        dmi_ny = _y_bonds(sy, sz) - _y_bonds(sz, sy)
 
-        dmi_nx = np.sum(direction_nx * cross_product_nx, axis=2) #scalar product
-        dmi_ny = np.sum(direction_ny * cross_product_ny, axis=2)
-
-        total_energy = -self.D * (np.sum(dmi_nx) + np.sum(dmi_ny))    
-        
+        total_energy = -self.D * (dmi_nx + dmi_ny)
 
         return total_energy
 
@@ -1,4 +1,5 @@
 import numpy as np
+import pytest
 
 import mcsim
 
@@ -63,3 +64,139 @@ class TestIndividualEnergies:
 
         assert np.allclose(system.s.array, system.s.mean, rtol=rtol, atol=atol)
         assert np.allclose(abs(system.s), 1, rtol=rtol, atol=0.1)
+
+
+class TestSeed:
+    def test_seed_reproducible(self):
+        n = (6, 6)
+        s1 = mcsim.Spins(n=n, value=(1, 1, 1))
+        s2 = mcsim.Spins(n=n, value=(1, 1, 1))
+
+        parameters = dict(B=(0, 0, 1), K=0.2, u=(0, 0, 1), J=1, D=0.5)
+        system1 = mcsim.System(s=s1, **parameters)
+        system2 = mcsim.System(s=s2, **parameters)
+
+        mcsim.Driver(seed=42).drive(system1, n=5_000)
+        mcsim.Driver(seed=42).drive(system2, n=5_000)
+
+        assert np.array_equal(system1.s.array, system2.s.array)
+        assert not np.allclose(system1.s.array, np.sqrt(3) / 3)
+
+    def test_current_energy(self):
+        n = (7, 5)
+        s = mcsim.Spins(n=n)
+        s.randomise()
+
+        system = mcsim.System(s=s, B=(0.1, 0, 1), K=0.3, u=(0, 0, 1), J=1, D=0.6)
+
+        mcsim.Driver(seed=1).drive(system, n=20_000)
+
+        assert np.isclose(system.current_energy, system.energy())
+
+
+class TestMetropolis:
+    def test_zero_temperature_energy_decreases(self):
+        n = (6, 6)
+        s = mcsim.Spins(n=n)
+        s.randomise()
+
+        system = mcsim.System(s=s, B=(0, 0, 1), K=0.2, u=(0, 0, 1), J=1, D=0.5)
+        driver = mcsim.Driver(seed=7)
+
+        energies = [system.energy()]
+        for _ in range(5):
+            driver.drive(system, n=1_000)
+            energies.append(system.energy())
+
+        assert all(e1 <= e0 for e0, e1 in zip(energies, energies[1:]))
+
+    def test_infinite_temperature(self):
+        n = (10, 10)
+        s = mcsim.Spins(n=n, value=(0, 0, 1))
+
+        system = mcsim.System(s=s, B=(0, 0, 1), K=0, u=(0, 0, 1), J=0, D=0)
+
+        # With beta = 0 every move is accepted and the spins drift away from B.
+        mcsim.Driver(seed=11).drive(system, n=100_000, alpha=0.5, beta=0)
+
+        assert system.s.mean[2] < 0.5
+        assert np.allclose(abs(system.s), 1)
+        assert np.isclose(system.current_energy, system.energy())
+
+    def test_finite_temperature(self):
+        n = (5, 5)
+        s = mcsim.Spins(n=n)
+        s.randomise()
+
+        system = mcsim.System(s=s, B=(1, 0, 0), K=0, u=(0, 1, 0), J=0, D=0)
+
+        mcsim.Driver(seed=5).drive(system, n=20_000, beta=20)
+
+        assert 0.8 < system.s.mean[0] < 1
+
+
+class TestRandomSpin:
+    def test_random_spin(self):
+        rng = np.random.default_rng(0)
+        s0 = np.array([0.0, 0.6, 0.8])
+
+        for alpha in [0.01, 0.1, 1]:
+            s1 = mcsim.driver.random_spin(s0, alpha=alpha, rng=rng)
+
+            assert isinstance(s1, np.ndarray)
+            assert np.isclose(np.linalg.norm(s1), 1)
+            assert np.linalg.norm(s1 - s0) < 2 * np.sqrt(3) * alpha
+
+
+class TestBatch:
+    def test_drive_batch(self):
+        n = (5, 5)
+        parameters = dict(B=(1, 0, 0), K=0, u=(0, 1, 0), J=0, D=0)
+
+        systems = []
+        for _ in range(4):
+            s = mcsim.Spins(n=n)
+            s.randomise()
+            systems.append(mcsim.System(s=s, **parameters))
+
+        mcsim.Driver(seed=2).drive_batch(systems, n=10_000)
+
+        for system in systems:
+            assert np.allclose(system.s.mean, (1, 0, 0), rtol=rtol, atol=atol)
+            assert np.allclose(abs(system.s), 1)
+            assert np.isclose(system.current_energy, system.energy())
+
+    def test_drive_batch_matches_drive(self):
+        n = (4, 6)
+        s1 = mcsim.Spins(n=n, value=(1, 0, 1))
+        s2 = mcsim.Spins(n=n, value=(1, 0, 1))
+
+        parameters = dict(B=(0, 0, 1), K=0.2, u=(0, 0, 1), J=1, D=0.5)
+        system1 = mcsim.System(s=s1, **parameters)
+        system2 = mcsim.System(s=s2, **parameters)
+
+        # With a single chain both methods draw the same random numbers.
+        mcsim.Driver(seed=9).drive(system1, n=3_000, beta=5)
+        mcsim.Driver(seed=9).drive_batch([system2], n=3_000, beta=5)
+
+        assert np.allclose(system1.s.array, system2.s.array)
+
+    def test_drive_batch_different_parameters(self):
+        n = (4, 4)
+        system1 = mcsim.System(s=mcsim.Spins(n=n), B=(0, 0, 1), K=0, u=(0, 0, 1), J=1, D=0)
+        system2 = mcsim.System(s=mcsim.Spins(n=n), B=(0, 0, 1), K=0, u=(0, 0, 1), J=2, D=0)
+
+        with pytest.raises(ValueError):
+            mcsim.Driver().drive_batch([system1, system2], n=10)
+
+    def test_drive_batch_empty(self):
+        with pytest.raises(ValueError):
+            mcsim.Driver().drive_batch([], n=10)
+
+    def test_drive_batch_shared_spins(self):
+        s = mcsim.Spins(n=(4, 4))
+        system1 = mcsim.System(s=s, B=(0, 0, 1), K=0, u=(0, 0, 1), J=1, D=0)
+        system2 = mcsim.System(s=s, B=(0, 0, 1), K=0, u=(0, 0, 1), J=1, D=0)
+
+        with pytest.raises(ValueError):
+            mcsim.Driver().drive_batch([system1, system2], n=10)
@@ -28,6 +28,18 @@ class TestInitialisation:
         with pytest.raises(ValueError):
             s = mcsim.Spins(n=n, value=value)
 
+    def test_init_dtype(self):
+        n = (3, 4)
+        for dtype in [np.float32, np.float64, "float32"]:
+            s = mcsim.Spins(n=n, dtype=dtype)
+            assert s.array.dtype == dtype
+
+    def test_init_wrong_dtype(self):
+        n = (3, 4)
+        for dtype in [np.float16, int, np.longdouble, np.complex128, "spam"]:
+            with pytest.raises(ValueError):
+                s = mcsim.Spins(n=n, dtype=dtype)
+
 
 class TestRandomise:
     def test_randomise_component_values(self):
@@ -117,3 +129,29 @@ class TestPlot:
         s.randomise()
 
         s.plot()  # There is no assert statement here.
+
+
+class TestComponents:
+    def test_components_view(self):
+        n = (4, 7)
+        s = mcsim.Spins(n=n)
+        s.randomise()
+
+        assert s.sx.shape == n
+        assert np.allclose(s.sx, s.array[..., 0])
+        assert np.allclose(s.sy, s.array[..., 1])
+        assert np.allclose(s.sz, s.array[..., 2])
+
+        s.array[1, 2] = (0, 1, 0)
+        assert (s.sx[1, 2], s.sy[1, 2], s.sz[1, 2]) == (0, 1, 0)
+
+    def test_components_contiguous(self):
+        n = (9, 4)
+        s = mcsim.Spins(n=n)
+        assert all(p.flags.c_contiguous for p in (s.sx, s.sy, s.sz))
+
+        s.randomise()
+        assert all(p.flags.c_contiguous for p in (s.sx, s.sy, s.sz))
+
+        s.array = np.asfortranarray(np.ones((*n, 3)))
+        assert all(p.flags.c_contiguous for p in (s.sx, s.sy, s.sz))
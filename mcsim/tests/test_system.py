@@ -1,6 +1,7 @@
 import numbers
 
 import numpy as np
+import pytest
 
 import mcsim
 
@@ -124,6 +125,41 @@ class TestAnisotropy:
 
         assert np.isclose(system.anisotropy(), -500)
 
+    def test_anisotropy_u_not_modified(self):
+        n = (4, 4)
+        s = mcsim.Spins(n=n)
+
+        u = np.array([0.0, 0.0, 2.0])
+
+        system1 = mcsim.System(s=s, B=(0, 0, 0), K=1, u=u, J=0, D=0)
+        system2 = mcsim.System(s=s, B=(0, 0, 0), K=1, u=u, J=0, D=0)
+
+        for _ in range(3):
+            assert np.isclose(system1.anisotropy(), -16)
+            assert np.isclose(system2.anisotropy(), -16)
+
+        assert np.allclose(u, (0, 0, 2))
+        assert np.allclose(system1.u, (0, 0, 1))
+
+    def test_anisotropy_spins_replaced(self):
+        s = mcsim.Spins(n=(4, 4))
+
+        system = mcsim.System(s=s, B=(0, 0, 0), K=1, u=(0, 0, 1), J=0, D=0)
+        assert np.isclose(system.anisotropy(), -16)
+
+        system.s = mcsim.Spins(n=(8, 8))
+        assert np.isclose(system.anisotropy(), -64)
+        assert np.isclose(system.energy(), -64)
+
+        system.s.array = np.ones((5, 6, 3)) * (0, 0, 1)
+        assert np.isclose(system.anisotropy(), -30)
+
+        mcsim.Driver(seed=0).drive(system, n=1_000)
+        assert np.isclose(system.current_energy, system.energy())
+
+        system.s = mcsim.Spins(n=(3, 3), dtype=np.float32)
+        assert np.isclose(system.anisotropy(), -9)
+
 
 class TestExchange:
     def test_exchange_zero(self):
@@ -173,6 +209,15 @@ class TestExchange:
 
         assert np.isclose(system.exchange(), -44)
 
+    def test_exchange_single_row(self):
+        for n in [(1, 6), (6, 1)]:
+            s = mcsim.Spins(n=n, value=(0, 0, 1))
+
+            system = mcsim.System(s=s, B=(0, 0, 1), K=1, u=(0, 1, 0), J=1, D=0.7)
+
+            assert np.isclose(system.exchange(), -5)
+            assert np.isclose(system.dmi(), 0)
+
 
 class TestDMI:
     def test_dmi_zero(self):
@@ -223,3 +268,114 @@ class TestDMI:
         assert np.isclose(system.dmi(), -5)
 
 
+
+
+class TestLocalEnergy:
+    def test_local_energy_difference(self):
+        n = (6, 7)
+        s = mcsim.Spins(n=n)
+        s.randomise()
+
+        B = (0.1, -0.3, 1)
+        K = 0.5
+        u = (0, 1, 1)
+        J = 1
+        D = 0.7
+
+        system = mcsim.System(s=s, B=B, K=K, u=u, J=J, D=D)
+
+        for i, j in [(0, 0), (2, 3), (5, 6), (0, 4), (3, 0)]:
+            original_spin = system.s.array[i, j].copy()
+            new_spin = mcsim.driver.random_spin(original_spin, alpha=0.5)
+
+            E0 = system.energy()
+            system.s.array[i, j] = new_spin
+            E1 = system.energy()
+
+            dE = system.local_energy(i, j, new_spin) - system.local_energy(i, j, original_spin)
+            assert np.isclose(dE, E1 - E0)
+
+    def test_local_energy_sum(self):
+        n = (5, 4)
+        s = mcsim.Spins(n=n)
+        s.randomise()
+
+        B = (0.1, -0.3, 1)
+        K = 0.5
+        u = (0, 1, 1)
+        J = 1
+        D = 0.7
+
+        system = mcsim.System(s=s, B=B, K=K, u=u, J=J, D=D)
+
+        # Every bond is counted by the local energies of both of its sites.
+        local_sum = sum(
+            system.local_energy(i, j, system.s.array[i, j])
+            for i in range(n[0])
+            for j in range(n[1])
+        )
+        expected = system.zeeman() + system.anisotropy() + 2 * (system.exchange() + system.dmi())
+
+        assert np.isclose(local_sum, expected)
+
+    def test_local_energy_out_of_bounds(self):
+        n = (4, 4)
+        s = mcsim.Spins(n=n)
+
+        system = mcsim.System(s=s, B=(0, 0, 1), K=0.5, u=(0, 0, 1), J=1, D=0.7)
+
+        for i, j in [(4, 0), (0, 4), (-1, 0), (0, -1)]:
+            with pytest.raises(IndexError):
+                system.local_energy(i, j, (0, 0, 1))
+
+    def test_local_energy_wrong_spin(self):
+        s = mcsim.Spins(n=(4, 4))
+
+        system = mcsim.System(s=s, B=(0, 0, 1), K=0.5, u=(0, 0, 1), J=1, D=0.7)
+
+        for spin in [(0, 1), (0, 0, 0, 1)]:
+            with pytest.raises(ValueError):
+                system.local_energy(1, 1, spin)
+
+        # Integer and float components give the same energy.
+        assert np.isclose(system.local_energy(1, 1, (0, 0, 1)), system.local_energy(1, 1, (0.0, 0.0, 1.0)))
+
+
+class TestEnergy:
+    def test_energy_sum(self):
+        # energy() sums exchange and dmi in a fused pass, which must agree
+        # with the individual terms.
+        for n in [(8, 9), (1, 5), (5, 1), (1, 1)]:
+            s = mcsim.Spins(n=n)
+            s.randomise()
+
+            B = (0.2, 0, 1)
+            K = 0.3
+            u = (1, 0, 1)
+            J = 1
+            D = 0.4
+
+            system = mcsim.System(s=s, B=B, K=K, u=u, J=J, D=D)
+
+            assert np.isclose(
+                system.energy(),
+                system.zeeman() + system.anisotropy() + system.exchange() + system.dmi(),
+            )
+
+    def test_energy_float32(self):
+        n = (10, 12)
+        s64 = mcsim.Spins(n=n)
+        s64.randomise()
+        s32 = mcsim.Spins(n=n, dtype=np.float32)
+        s32.array = s64.array
+
+        parameters = dict(B=(0.2, 0, 1), K=0.3, u=(1, 0, 1), J=1, D=0.4)
+        system64 = mcsim.System(s=s64, **parameters)
+        system32 = mcsim.System(s=s32, **parameters)
+
+        assert system32.s.array.dtype == np.float32
+        assert np.isclose(system32.energy(), system64.energy(), rtol=1e-5)
+
+        mcsim.Driver(seed=3).drive(system32, n=1_000)
+        assert system32.s.array.dtype == np.float32
+        assert np.isclose(system32.current_energy, system32.energy(), rtol=1e-4)